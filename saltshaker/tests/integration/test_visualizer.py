@@ -8,39 +8,30 @@ import pandas as pd
 from saltshaker.layout.engine import LayoutEngine
 from saltshaker.config import PlotConfig
 
+_VALID_EVENT_TYPES = frozenset({'del', 'dup'})
+
 
 @pytest.mark.integration
 @pytest.mark.visualizer
 class TestBasicIntegration:
     """Basic integration tests"""
     
-    def test_engine_initialization(self):
+    def test_engine_initialization(self, default_engine):
         """Test engine initializes correctly"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        assert engine is not None
-        assert engine.genome_length == 16569
+        assert default_engine is not None
+        assert default_engine.genome_length == 16569
     
-    def test_separate_events(self, viz_sample_small):
+    def test_separate_events(self, viz_sample_small, viz_dels_small, viz_dups_small):
         """Test separating deletions and duplications"""
-        dels = viz_sample_small[viz_sample_small['final_event'] == 'del'].copy()
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        
-        assert len(dels) == 2
-        assert len(dups) == 13
-        assert len(dels) + len(dups) == len(viz_sample_small)
-    
-    def test_space_calculation_pipeline(self, viz_sample_small):
+        assert len(viz_dels_small) == 2
+        assert len(viz_dups_small) == 13
+        assert len(viz_dels_small) + len(viz_dups_small) == len(viz_sample_small)
+
+    def test_space_calculation_pipeline(self, default_engine, viz_dups_small):
         """Test space calculation works in pipeline"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        
         # Should be able to calculate space
-        space = engine._calculate_required_space(dups, 'dup')
-        
+        space = default_engine._calculate_required_space(viz_dups_small, 'dup')
+
         assert space > 0
 
 
@@ -49,39 +40,34 @@ class TestBasicIntegration:
 class TestDataIntegrity:
     """Test data integrity across pipeline"""
     
-    def test_all_groups_present(self, viz_sample_small, visualizer_layouts):
+    def test_all_groups_present(self, viz_stats_small, expected_small):
         """Test all expected groups are present"""
-        expected = visualizer_layouts['viz_sample_small']
-        
-        actual_groups = set(viz_sample_small['group'].unique())
-        expected_groups = set(expected['group_list'])
-        
+        actual_groups = viz_stats_small['groups']
+        expected_groups = set(expected_small.group_list)
+
         missing = expected_groups - actual_groups
         extra = actual_groups - expected_groups
-        
+
         assert len(missing) == 0, f"Missing groups: {missing}"
         assert len(extra) == 0, f"Extra groups: {extra}"
-    
-    def test_event_counts_match(self, viz_sample_small, visualizer_layouts):
+
+    def test_event_counts_match(self, viz_stats_small, expected_small):
         """Test event counts match expectations"""
-        expected = visualizer_layouts['viz_sample_small']
-        
-        assert len(viz_sample_small) == expected['total_events']
-        
-        dels = len(viz_sample_small[viz_sample_small['final_event'] == 'del'])
-        dups = len(viz_sample_small[viz_sample_small['final_event'] == 'dup'])
-        
-        assert dels == expected['del_events']
-        assert dups == expected['dup_events']
+        assert viz_stats_small['n'] == expected_small.total_events
+        assert viz_stats_small['n_del'] == expected_small.del_events
+        assert viz_stats_small['n_dup'] == expected_small.dup_events
     
     def test_group_assignments_consistent(self, viz_sample_small):
         """Test group assignments are consistent"""
-        # Each event should have a group
-        assert viz_sample_small['group'].notna().all()
-        assert (viz_sample_small['group'] != '').all()
-        
-        # Groups should be strings
-        assert all(isinstance(g, str) for g in viz_sample_small['group'].unique())
+        group = viz_sample_small['group']
+
+        # Each event should have a group - one fused mask instead of
+        # separate notna/non-empty passes
+        bad = group.isna() | (group == '')
+        assert not bad.any()
+
+        # Groups should be strings (O(1) dtype check, not a per-element loop)
+        assert group.dtype == 'category' or pd.api.types.is_string_dtype(group)
 
 
 @pytest.mark.integration
@@ -89,19 +75,17 @@ class TestDataIntegrity:
 class TestLargeDataset:
     """Tests with larger dataset"""
     
-    def test_large_sample_loads(self, viz_sample_large, visualizer_layouts):
+    def test_large_sample_loads(self, viz_sample_large, expected_large):
         """Test large sample loads correctly"""
-        expected = visualizer_layouts['viz_sample_large']
-        
-        assert len(viz_sample_large) == expected['total_events']
-        assert len(viz_sample_large['group'].unique()) == expected['total_groups']
+        assert len(viz_sample_large) == expected_large.total_events
+        assert len(viz_sample_large['group'].unique()) == expected_large.total_groups
     
     def test_large_sample_structure(self, viz_sample_large):
         """Test large sample has valid structure"""
         # Should have required columns
         required = ['cluster', 'group', 'final_event', 'del_start_median', 'del_end_median']
-        for col in required:
-            assert col in viz_sample_large.columns
+        missing = set(required) - set(viz_sample_large.columns)
+        assert not missing, f"Missing columns: {missing}"
         
         # Should have both event types
         event_types = set(viz_sample_large['final_event'].unique())
@@ -117,23 +101,24 @@ class TestRegressionProtection:
     def test_coordinates_within_genome(self, viz_sample_small):
         """Test all coordinates are within genome bounds"""
         genome_length = 16569
-        
-        assert (viz_sample_small['del_start_median'] >= 0).all()
-        assert (viz_sample_small['del_start_median'] <= genome_length).all()
-        assert (viz_sample_small['del_end_median'] >= 0).all()
-        assert (viz_sample_small['del_end_median'] <= genome_length).all()
+
+        # One fused range check per column instead of four separate scans
+        assert viz_sample_small['del_start_median'].between(0, genome_length).all()
+        assert viz_sample_small['del_end_median'].between(0, genome_length).all()
     
     def test_no_missing_groups(self, viz_sample_small):
         """Test no events have missing group assignments"""
-        assert viz_sample_small['group'].notna().all()
-        assert (viz_sample_small['group'] != '').all()
+        group = viz_sample_small['group']
+
+        bad = group.isna() | (group == '')
+        assert not bad.any()
     
     def test_event_types_valid(self, viz_sample_small):
         """Test all event types are valid"""
-        valid_types = {'del', 'dup'}
-        actual_types = set(viz_sample_small['final_event'].unique())
-        
-        assert actual_types.issubset(valid_types)
+        # Categories are already unique - no O(N) unique() pass needed
+        actual_types = frozenset(viz_sample_small['final_event'].cat.categories)
+
+        assert actual_types <= _VALID_EVENT_TYPES
     
     def test_group_format_valid(self, viz_sample_small):
         """Test group names have valid format"""
@@ -147,37 +132,24 @@ class TestRegressionProtection:
 class TestConfigPresets:
     """Test different config presets work"""
     
-    def test_default_config_works(self):
+    def test_default_config_works(self, default_engine):
         """Test default config works"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        assert engine is not None
-    
-    def test_publication_config_works(self):
-        """Test publication config works"""
-        config = PlotConfig.publication()
-        engine = LayoutEngine(config)
-        assert engine is not None
-        assert engine.config.dpi == 600
-    
-    def test_presentation_config_works(self):
-        """Test presentation config works"""
-        config = PlotConfig.presentation()
-        engine = LayoutEngine(config)
-        assert engine is not None
-        assert engine.config.dpi == 150
-    
-    def test_compact_config_works(self):
-        """Test compact config works"""
-        config = PlotConfig.compact()
-        engine = LayoutEngine(config)
-        assert engine is not None
-    
-    def test_debug_config_works(self):
-        """Test debug config works"""
-        config = PlotConfig.debug()
+        assert default_engine is not None
+
+    @pytest.mark.parametrize("preset,expected_dpi", [
+        ('publication', 600),
+        ('presentation', 150),
+        ('compact', None),
+        ('debug', None),
+    ])
+    def test_preset_config_works(self, preset, expected_dpi):
+        """Test each preset config builds a working engine"""
+        config = getattr(PlotConfig, preset)()
         engine = LayoutEngine(config)
+
         assert engine is not None
+        if expected_dpi is not None:
+            assert engine.config.dpi == expected_dpi
 
 
 @pytest.mark.integration
@@ -185,19 +157,17 @@ class TestConfigPresets:
 class TestEdgeCases:
     """Test edge cases"""
     
-    def test_empty_dataframe(self):
+    def test_empty_dataframe(self, default_engine):
         """Test handling of empty DataFrame"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
         empty = pd.DataFrame()
-        space = engine._calculate_required_space(empty, 'del')
-        
+        space = default_engine._calculate_required_space(empty, 'del')
+
         assert space == 0.0
     
     def test_single_group_filtering(self, viz_sample_small):
         """Test filtering to single group"""
-        single_group = viz_sample_small[viz_sample_small['group'] == 'G1'].copy()
+        # Read-only slice - no need to copy
+        single_group = viz_sample_small[viz_sample_small['group'] == 'G1']
         
         assert len(single_group) > 0
         assert len(single_group['group'].unique()) == 1
@@ -232,12 +202,8 @@ def test_smoke_fixtures(viz_sample_small, viz_sample_large, visualizer_layouts):
 
 @pytest.mark.integration
 @pytest.mark.visualizer
-def test_smoke_engine_with_data(viz_sample_small):
+def test_smoke_engine_with_data(default_engine, viz_dups_small):
     """Smoke test: Engine works with real data"""
-    config = PlotConfig()
-    engine = LayoutEngine(config)
-    
-    dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-    space = engine._calculate_required_space(dups, 'dup')
-    
+    space = default_engine._calculate_required_space(viz_dups_small, 'dup')
+
     assert space > 0
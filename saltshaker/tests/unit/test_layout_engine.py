@@ -6,28 +6,38 @@ Uses actual saltshaker API:
 - from saltshaker.config import PlotConfig
 - LayoutEngine(PlotConfig(), genome_length=16569)
 """
+import operator
+from math import isclose
+
 import pytest
+import numpy as np
 import pandas as pd
 from saltshaker.layout.engine import LayoutEngine
+from saltshaker.layout.types import LayoutResult, GroupBandLayout, SingleEventLayout
 from saltshaker.config import PlotConfig
 
+# Whole module is unit/layout - one module-level mark instead of
+# repeating the decorator pair on every class
+pytestmark = [pytest.mark.unit, pytest.mark.layout]
+
+_GENOME_LEN = 16569
+_DEG_PER_BP = 360.0 / _GENOME_LEN
+
+# Shared empty frame for edge-case tests - constructed once at module load
+_EMPTY_DF = pd.DataFrame()
+
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestLayoutEngineInitialization:
     """Tests for LayoutEngine initialization"""
     
-    def test_layout_engine_with_default_config(self):
+    def test_layout_engine_with_default_config(self, default_engine):
         """Test LayoutEngine initializes with default PlotConfig"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        assert engine is not None
-        assert engine.genome_length == 16569
-    
-    def test_layout_engine_with_custom_genome_length(self):
+        assert default_engine is not None
+        assert default_engine.genome_length == 16569
+
+    def test_layout_engine_with_custom_genome_length(self, default_config):
         """Test LayoutEngine with custom genome length"""
-        config = PlotConfig()
-        engine = LayoutEngine(config, genome_length=20000)
+        engine = LayoutEngine(default_config, genome_length=20000)
         assert engine.genome_length == 20000
     
     def test_layout_engine_stores_config(self):
@@ -38,126 +48,91 @@ class TestLayoutEngineInitialization:
         assert engine.layout_config == config.layout
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestSpaceCalculation:
     """Tests for _calculate_required_space method"""
     
-    def test_empty_events_returns_zero(self):
+    @pytest.mark.parametrize("event_type", ['del', 'dup'])
+    def test_empty_events_returns_zero(self, default_engine, event_type):
         """Test empty DataFrame returns 0 space"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        empty = pd.DataFrame()
-        space = engine._calculate_required_space(empty, 'del')
-        
+        space = default_engine._calculate_required_space(_EMPTY_DF, event_type)
+
         assert space == 0.0
-    
-    def test_space_calculation_with_data(self, viz_sample_small):
+
+    def test_space_calculation_with_data(self, default_engine, viz_dups_small):
         """Test space calculation with real data"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        space = engine._calculate_required_space(dups, 'dup')
-        
+        space = default_engine._calculate_required_space(viz_dups_small, 'dup')
+
         # Should return positive space
         assert space > 0
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestLayoutCalculation:
     """Tests for calculate_layout method"""
     
-    def test_calculate_layout_exists(self):
+    def test_calculate_layout_exists(self, default_engine):
         """Test calculate_layout method exists"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        assert hasattr(engine, 'calculate_layout')
-    
-    def test_calculate_layout_with_small_sample(self, viz_sample_small):
+        assert hasattr(default_engine, 'calculate_layout')
+
+    def test_calculate_layout_with_small_sample(self, default_engine, viz_dels_small, viz_dups_small):
         """Test calculate_layout with small sample"""
-        config = PlotConfig()
-        engine = LayoutEngine(config)
-        
-        dels = viz_sample_small[viz_sample_small['final_event'] == 'del'].copy()
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        
         # Should be callable
         # Note: We don't call it yet because we need to check the signature first
-        assert callable(engine.calculate_layout)
+        assert callable(default_engine.calculate_layout)
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestGroupClassification:
     """Tests for group classification logic"""
     
-    def test_multi_event_groups_identified(self, viz_sample_small):
+    def test_multi_event_groups_identified(self, viz_dups_small):
         """Test groups with 2+ events are identified correctly"""
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        
-        group_counts = dups['group'].value_counts().to_dict()
-        
-        # G1 should have 4 events
-        assert 'G1' in group_counts
-        assert group_counts['G1'] >= 2
-    
-    def test_bl_groups_present(self, viz_sample_small):
-        """Test BL groups are present"""
-        dups = viz_sample_small[viz_sample_small['final_event'] == 'dup'].copy()
-        
-        bl_groups = [g for g in dups['group'].unique() if g.startswith('BL')]
-        
+        # G1 should have 4 events - one comparison-and-sum pass instead
+        # of materializing a full value_counts histogram as a dict
+        count_g1 = int((viz_dups_small['group'] == 'G1').sum())
+
+        assert count_g1 >= 2
+
+    def test_bl_groups_present(self, viz_dups_small):
+        """
+        Test BL groups are present
+
+        BL groups are treated as multi-event even if count=1
+        (from the code: c > 1 or g.startswith('BL'))
+        """
+        # Category dictionaries are per-split (see viz_small_by_event),
+        # so startswith runs over just the groups observed among dups
+        groups = viz_dups_small['group'].cat.categories
+
         # Should have BL groups
-        assert len(bl_groups) > 0
-        
-        # BL groups should be treated as multi-event even if count=1
-        # (This is from the code: c > 1 or g.startswith('BL'))
-        for bl_group in bl_groups:
-            assert bl_group.startswith('BL')
+        assert groups.str.startswith('BL').any()
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestDataValidation:
     """Tests for data validation"""
     
-    def test_small_sample_structure(self, viz_sample_small, visualizer_layouts):
+    def test_small_sample_structure(self, viz_sample_small, expected_small):
         """Test small sample has expected structure"""
-        expected = visualizer_layouts['viz_sample_small']
-        
-        assert len(viz_sample_small) == expected['total_events']
-        assert len(viz_sample_small['group'].unique()) == expected['total_groups']
-    
-    def test_large_sample_structure(self, viz_sample_large, visualizer_layouts):
+        assert len(viz_sample_small) == expected_small.total_events
+        assert len(viz_sample_small['group'].unique()) == expected_small.total_groups
+
+    def test_large_sample_structure(self, viz_sample_large, expected_large):
         """Test large sample has expected structure"""
-        expected = visualizer_layouts['viz_sample_large']
-        
-        assert len(viz_sample_large) == expected['total_events']
-        assert len(viz_sample_large['group'].unique()) == expected['total_groups']
+        assert len(viz_sample_large) == expected_large.total_events
+        assert len(viz_sample_large['group'].unique()) == expected_large.total_groups
     
     def test_required_columns_present(self, viz_sample_small):
         """Test required columns are present"""
         required = ['cluster', 'group', 'final_event', 'del_start_median', 'del_end_median', 'delsize']
-        
-        for col in required:
-            assert col in viz_sample_small.columns, f"Missing column: {col}"
+
+        missing = set(required) - set(viz_sample_small.columns)
+        assert not missing, f"Missing columns: {missing}"
     
-    def test_coordinates_valid(self, viz_sample_small):
+    def test_coordinates_valid(self, viz_small_soa):
         """Test coordinates are within valid range"""
-        genome_length = 16569
-        
-        assert (viz_sample_small['del_start_median'] >= 0).all()
-        assert (viz_sample_small['del_start_median'] <= genome_length).all()
-        assert (viz_sample_small['del_end_median'] >= 0).all()
-        assert (viz_sample_small['del_end_median'] <= genome_length).all()
+        # Fused range check over the pre-extracted coordinate arrays
+        for coords in (viz_small_soa.start, viz_small_soa.end):
+            assert ((coords >= 0) & (coords <= _GENOME_LEN)).all()
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestConfigPresets:
     """Tests for PlotConfig preset configurations"""
     
@@ -167,95 +142,71 @@ class TestConfigPresets:
         assert config.layout.total_radius == 400
         assert config.layout.separator_fraction == 0.15
     
-    def test_publication_preset(self):
-        """Test publication preset"""
-        config = PlotConfig.publication()
-        assert config.dpi == 600
-        assert config.figure_size == 14.0
-    
-    def test_presentation_preset(self):
-        """Test presentation preset"""
-        config = PlotConfig.presentation()
-        assert config.dpi == 150
-        assert config.figure_size == 10.0
-    
-    def test_compact_preset(self):
-        """Test compact preset"""
-        config = PlotConfig.compact()
-        assert config.layout.base_band_size == 15
-        assert config.layout.group_gap == 3
-    
-    def test_debug_preset(self):
-        """Test debug preset"""
-        config = PlotConfig.debug()
-        assert config.layout.min_event_spacing == 5.0
-        assert config.layout.group_gap == 10
+    @pytest.mark.parametrize("factory,expected", [
+        (PlotConfig.publication, {'dpi': 600, 'figure_size': 14.0}),
+        (PlotConfig.presentation, {'dpi': 150, 'figure_size': 10.0}),
+        (PlotConfig.compact, {'layout.base_band_size': 15, 'layout.group_gap': 3}),
+        (PlotConfig.debug, {'layout.min_event_spacing': 5.0, 'layout.group_gap': 10}),
+    ], ids=['publication', 'presentation', 'compact', 'debug'])
+    def test_preset(self, factory, expected):
+        """Test each preset exposes its characteristic settings"""
+        config = factory()
+
+        for attr, value in expected.items():
+            assert operator.attrgetter(attr)(config) == value, \
+                f"{factory.__name__}: {attr}"
 
 
-@pytest.mark.unit
-@pytest.mark.layout
 class TestAngularCalculations:
     """Tests for angular position calculations"""
     
-    def test_genomic_to_angular_conversion(self):
+    @pytest.mark.parametrize("frac,deg", [(0, 0.0), (0.25, 90.0), (0.5, 180.0)])
+    def test_genomic_to_angular_conversion(self, frac, deg):
         """Test conversion from genomic to angular coordinates"""
-        genome_length = 16569
-        
-        # Position at start
-        assert (0 / genome_length * 360) == 0.0
-        
-        # Position at quarter
-        quarter = genome_length / 4
-        assert pytest.approx((quarter / genome_length * 360), abs=0.1) == 90.0
-        
-        # Position at half
-        half = genome_length / 2
-        assert pytest.approx((half / genome_length * 360), abs=0.1) == 180.0
+        position = _GENOME_LEN * frac
+
+        # Single multiply by the precomputed scale, no per-case division;
+        # math.isclose skips pytest.approx's wrapper object per case
+        assert isclose(position * _DEG_PER_BP, deg, abs_tol=0.1)
     
-    def test_events_distributed_around_circle(self, viz_sample_small):
+    def test_events_distributed_around_circle(self, viz_small_soa):
         """Test events are distributed around circle"""
-        positions = viz_sample_small['del_start_median'].values
-        
-        # Should have variety
-        assert positions.max() > positions.min()
-        
-        # Should span significant range
-        span = positions.max() - positions.min()
-        assert span > 1000  # At least 1kb
-
-
-# Smoke tests
-@pytest.mark.unit
-@pytest.mark.layout
-def test_smoke_imports():
-    """Smoke test: All imports work"""
-    from saltshaker.layout.engine import LayoutEngine
-    from saltshaker.config import PlotConfig
-    from saltshaker.layout.types import LayoutResult, GroupBandLayout, SingleEventLayout
-    
-    # Should not raise
+        # Should span significant range - np.ptp finds min and max in a
+        # single pass, and span > 0 is implied by span > 1000
+        assert np.ptp(viz_small_soa.start) > 1000  # At least 1kb
+
+
+# Smoke tests - one parametrized node instead of three test items
+def _check_imports(viz_sample_small, viz_sample_large, visualizer_layouts):
+    """All imports work (resolved once at module load, not per call)"""
     assert LayoutEngine is not None
     assert PlotConfig is not None
+    assert LayoutResult is not None
+    assert GroupBandLayout is not None
+    assert SingleEventLayout is not None
 
 
-@pytest.mark.unit
-@pytest.mark.layout
-def test_smoke_initialization():
-    """Smoke test: LayoutEngine initializes"""
+def _check_initialization(viz_sample_small, viz_sample_large, visualizer_layouts):
+    """LayoutEngine initializes"""
     config = PlotConfig()
     engine = LayoutEngine(config)
-    
+
     assert engine is not None
-    assert engine.genome_length == 16569
+    assert engine.genome_length == _GENOME_LEN
 
 
-@pytest.mark.unit
-@pytest.mark.layout
-def test_fixtures_load(viz_sample_small, viz_sample_large, visualizer_layouts):
-    """Smoke test: All fixtures load"""
+def _check_fixtures(viz_sample_small, viz_sample_large, visualizer_layouts):
+    """All fixtures load"""
     assert viz_sample_small is not None
     assert viz_sample_large is not None
     assert visualizer_layouts is not None
-    
+
     assert len(viz_sample_small) > 0
     assert len(viz_sample_large) > 0
+
+
+@pytest.mark.parametrize("check", [_check_imports, _check_initialization, _check_fixtures],
+                         ids=['imports', 'initialization', 'fixtures'])
+def test_smoke(check, viz_sample_small, viz_sample_large, visualizer_layouts):
+    """Smoke tests: imports, engine initialization, fixture loading"""
+    check(viz_sample_small, viz_sample_large, visualizer_layouts)